@@ -2,6 +2,7 @@
 import importlib
 import os
 import json
+import queue
 import threading
 import time
 from pathlib import Path
@@ -10,11 +11,20 @@ from modules.utils.logger import log
 MODULES_DIR = Path(__file__).parent
 REGISTRY_FILE = Path(__file__).parents[2] / "module_registry.json"
 
+# Names of modules whose thread has exited; the supervisor blocks on this
+RESTART_Q = queue.Queue()
+
+# Seconds to wait before restarting a dead module; doubles while it keeps dying
+# young and resets once a run outlasts MAX_RESTART_DELAY
+RESTART_DELAY = 5
+MAX_RESTART_DELAY = 300
+
 def load_registry():
-    if REGISTRY_FILE.exists():
-        with open(REGISTRY_FILE, "r") as f:
+    try:
+        with open(REGISTRY_FILE, "rb") as f:
             return json.load(f)
-    return []
+    except FileNotFoundError:
+        return []
 
 def load_module(module_name):
     try:
@@ -36,6 +46,8 @@ def run_module(module_info):
                 mod.run()
             except Exception as e:
                 log(f"Module {module_name} error: {e}")
+            finally:
+                RESTART_Q.put(module_name)
         thread = threading.Thread(target=target, name=module_name, daemon=True)
         thread.start()
         return thread
@@ -46,24 +58,39 @@ def run_module(module_info):
 def main_loop():
     log("Spiral Conjuror starting...")
     registry = load_registry()
-    threads = []
+    registry_by_name = {m["name"]: m for m in registry if m.get("name") and m.get("category") == "conjuror"}
+    threads = {}  # name -> (thread, monotonic start time, current restart delay)
+    pending = {}  # name -> monotonic time its restart is due
 
-    for module_info in registry:
-        if module_info.get("category") == "conjuror":
-            t = run_module(module_info)
-            if t:
-                threads.append(t)
+    def start(name, delay):
+        t = run_module(registry_by_name[name])
+        if t:
+            threads[name] = (t, time.monotonic(), delay)
+        else:
+            threads.pop(name, None)
+
+    for name in registry_by_name:
+        start(name, RESTART_DELAY)
 
     try:
         while True:
-            time.sleep(5)
-            for t in list(threads):
-                if not t.is_alive():
-                    log(f"Thread {t.name} died, restarting...")
-                    info = next((m for m in registry if m["name"] == t.name), None)
-                    if info:
-                        threads.remove(t)
-                        threads.append(run_module(info))
+            timeout = max(0, min(pending.values()) - time.monotonic()) if pending else None
+            try:
+                name = RESTART_Q.get(timeout=timeout)
+            except queue.Empty:
+                name = None
+            if name in threads:
+                _, started, delay = threads[name]
+                if time.monotonic() - started >= MAX_RESTART_DELAY:
+                    delay = RESTART_DELAY
+                pending[name] = time.monotonic() + delay
+                threads[name] = (None, started, min(delay * 2, MAX_RESTART_DELAY))
+                log(f"Thread {name} died, restarting in {delay}s...")
+            now = time.monotonic()
+            for name, due in list(pending.items()):
+                if due <= now:
+                    del pending[name]
+                    start(name, threads[name][2])
     except KeyboardInterrupt:
         log("Spiral Conjuror stopping...")
 
@@ -4,8 +4,20 @@ from pathlib import Path
 
 LOG_FILE = Path(__file__).parents[2] / "conjuror.log"
 
+# Last formatted second, reused for every message logged within it
+_LAST_T = 0
+_LAST_S = ""
+
+def _timestamp():
+    global _LAST_T, _LAST_S
+    t = int(time.time())
+    if t != _LAST_T:
+        _LAST_S = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+        _LAST_T = t
+    return _LAST_S
+
 def log(message):
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = _timestamp()
     with open(LOG_FILE, "a") as f:
         f.write(f"[{timestamp}] {message}\n")
     print(f"[{timestamp}] {message}")
@@ -2,6 +2,8 @@
 import time
 from profile_store import ProfileStore
 
+_REDACTED = "[REDACTED: Low trust level]"
+
 class AIGuard:
     def __init__(self, profile_store=None):
         self.profile_store = profile_store or ProfileStore()
@@ -23,11 +25,8 @@ class AIGuard:
 
     def guard_output(self, text: str, profile_name: str = "default") -> str:
         """Filter or adapt text output based on profile trust level."""
+        # Read the profile on every call so in-place edits to it take effect
         profile = self.profile_store.get_profile(profile_name)
-        if not profile:
-            return text
-
-        trust = profile.get("trust_level", 0)
-        if trust < 1:
-            return "[REDACTED: Low trust level]"
+        if profile and profile.get("trust_level", 0) < 1:
+            return _REDACTED
         return text
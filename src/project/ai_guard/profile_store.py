@@ -23,8 +23,18 @@ class ProfileStore:
         }
 
     def save_profiles(self):
-        with open(self.filename, "w") as f:
-            json.dump(self._profiles, f, indent=2)
+        # Serialize once, write through a raw fd, then atomically swap into place
+        data = json.dumps(self._profiles, indent=2).encode("utf-8")
+        tmp_path = self.filename + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.filename)
 
     def get_profile(self, name: str):
         return self._profiles.get(name)
@@ -25,7 +25,12 @@ def backup_repo(path):
     os.makedirs(BACKUP_DIR, exist_ok=True)
     timestamp = int(time.time())
     backup_path = os.path.join(BACKUP_DIR,f"backup_{timestamp}")
-    shutil.copytree(path, backup_path)
+    # cp --reflink=auto shares extents on CoW filesystems and copies in-kernel otherwise
+    try:
+        subprocess.run(["cp","--reflink=auto","-a",path,backup_path], check=True, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(backup_path, ignore_errors=True)
+        shutil.copytree(path, backup_path)
     log(f"Backup created at {backup_path}")
     return backup_path
 
@@ -4,28 +4,90 @@ Ecosystem Integration Adapters
 Wires your existing components into the circulatory system without major rewrites
 """
 
-import json
+import functools
+import itertools
 import logging
+import re
 import threading
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional
 from ecosystem_circulatory_system import EcosystemComponent, EcosystemBus, EcosystemNeuralNetwork, EcosystemEvent
 
 logger = logging.getLogger(__name__)
 
+# Sentiment vocabulary, matched against whole words
+_POSITIVE_WORDS = frozenset({'good', 'great', 'excellent', 'love', 'amazing', 'perfect', 'awesome', 'brilliant'})
+_NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'awful', 'hate', 'horrible', 'worst', 'failed', 'broken'})
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Oldest observations / least recently set desires are dropped past these sizes
+_MAX_OBSERVATIONS = 10000
+_MAX_DESIRES = 1000
+
+def _new_affinity():
+    return {"score": 0.0}
+
+@dataclass(slots=True)
+class Observation:
+    """A single awareness_mod observation"""
+    time: float
+    source: str
+    note: str
+
+# GitHub priority -> Nexus priority
+_NEXUS_PRIORITY = {
+    "critical": "high",
+    "high": "high",
+    "medium": "medium",
+    "low": "low"
+}
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_sentiment(text: str) -> float:
+    """Simple sentiment analysis (could be enhanced with real NLP)"""
+    words = _WORD_RE.findall(text.lower())
+    positive_score = sum(1 for word in words if word in _POSITIVE_WORDS)
+    negative_score = sum(1 for word in words if word in _NEGATIVE_WORDS)
+    
+    if positive_score + negative_score == 0:
+        return 0.5  # Neutral
+    
+    return positive_score / (positive_score + negative_score)
+
+# Keyword matchers for Aetherius handlers
+_PROGRESS_RE = re.compile(r"\b(?:fixed|implemented|completed|merged)\b", re.I)
+_GITHUB_GOAL_RE = re.compile(r"github|issue", re.I)
+
 class AkashaOSAdapter(EcosystemComponent):
     """Adapter to integrate AkashaOS with the ecosystem"""
     
+    __slots__ = ("akasha_memory", "active_modules", "_mem_counter", "_mem_version", "_last_broadcast_version", "_locks")
+    
     def __init__(self, bus: EcosystemBus, neural: EcosystemNeuralNetwork, akasha_memory: Dict):
         super().__init__("akasha_os", bus, neural)
         self.capabilities = {
-            "task_types": ["introspection", "memory_management", "pattern_detection", "awareness", "planning"],
-            "capabilities": ["observe", "remember", "analyze", "introspect", "plan", "desire", "endear"],
-            "modules": ["awareness_mod", "longing_mod", "plan_mod", "endearment_mod", "sentience_scaffold_mod"]
+            "task_types": ("introspection", "memory_management", "pattern_detection", "awareness", "planning"),
+            "capabilities": ("observe", "remember", "analyze", "introspect", "plan", "desire", "endear"),
+            "modules": ("awareness_mod", "longing_mod", "plan_mod", "endearment_mod", "sentience_scaffold_mod")
         }
         self.akasha_memory = akasha_memory
         self.active_modules = []
         
+        # Set from _mem_counter by every memory mutation; the monitor compares it instead of
+        # re-serializing memory. next() on a count is atomic, unlike += from several threads,
+        # and every value is unique, so a late store can't hide a change from the monitor.
+        self._mem_counter = itertools.count(1)
+        self._mem_version = 0
+        self._last_broadcast_version = 0
+        
+        # One lock per memory subtree so unrelated mutations don't contend
+        self._locks = {
+            module: threading.Lock()
+            for module in ("awareness_mod", "longing_mod", "endearment_mod", "plan_mod")
+        }
+        
         # Subscribe to module activation requests
         self.bus.subscribe("neural.suggest_module_activation", self._handle_module_activation, self.name)
         self.bus.subscribe("github.issue_discovered", self._handle_github_issue, self.name)
@@ -36,75 +98,85 @@ class AkashaOSAdapter(EcosystemComponent):
     
     def _handle_module_activation(self, event: EcosystemEvent):
         """Handle neural network suggestions for module activation"""
-        suggested_modules = event.data.get("suggested_modules", [])
-        issue_data = event.data.get("issue", {})
-        
-        for module in suggested_modules:
-            if module not in self.active_modules:
-                self.active_modules.append(module)
-                
-                # Activate the module based on the issue
-                if module == "awareness_mod":
-                    self._activate_awareness_module(issue_data)
-                elif module == "longing_mod":
-                    self._activate_longing_module(issue_data)
-                elif module == "plan_mod":
-                    self._activate_plan_module(issue_data)
-        
-        self.publish_event(
-            "modules_activated",
-            {
-                "modules": suggested_modules,
-                "issue": issue_data,
-                "reasoning": event.data.get("reasoning")
-            },
-            correlation_id=event.correlation_id
-        )
-    
+        with self.bus.batch():
+            suggested_modules = event.data.get("suggested_modules", [])
+            issue_data = event.data.get("issue", {})
+
+            for module in suggested_modules:
+                if module not in self.active_modules:
+                    self.active_modules.append(module)
+
+                    # Activate the module based on the issue
+                    if module == "awareness_mod":
+                        self._activate_awareness_module(issue_data)
+                    elif module == "longing_mod":
+                        self._activate_longing_module(issue_data)
+                    elif module == "plan_mod":
+                        self._activate_plan_module(issue_data)
+
+            self.publish_event(
+                "modules_activated",
+                {
+                    "modules": suggested_modules,
+                    "issue": issue_data,
+                    "reasoning": event.data.get("reasoning")
+                },
+                correlation_id=event.correlation_id
+            )
+
     def _handle_github_issue(self, event: EcosystemEvent):
         """Process GitHub issues through AkashaOS awareness"""
-        issue = event.data
-        
-        # Create awareness observation
-        observation = f"GitHub issue detected: {issue.get('title')} - {issue.get('description', '')[:200]}"
-        self._create_observation("github_scanner", observation)
-        
-        # Check if this creates any desires
-        if issue.get('priority') == 'high':
-            self._create_desire("solve_github_issue", f"Solve {issue.get('title')}", intensity=0.8)
-        
-        self.publish_event(
-            "issue_processed",
-            {
-                "issue_id": issue.get('id'),
-                "observation_created": True,
-                "desire_intensity": 0.8 if issue.get('priority') == 'high' else 0.4
-            },
-            correlation_id=event.correlation_id
-        )
-    
+        with self.bus.batch():
+            issue = event.data
+            title = issue.get('title')
+            high_priority = issue.get('priority') == 'high'
+
+            # Observation, desire and summary are published together
+            pending = []
+
+            # Create awareness observation
+            observation = f"GitHub issue detected: {title} - {issue.get('description', '')[:200]}"
+            self._create_observation("github_scanner", observation, pending)
+
+            # Check if this creates any desires
+            if high_priority:
+                self._create_desire("solve_github_issue", f"Solve {title}", intensity=0.8, pending=pending)
+
+            pending.append((
+                "issue_processed",
+                {
+                    "issue_id": issue.get('id'),
+                    "observation_created": True,
+                    "desire_intensity": 0.8 if high_priority else 0.4
+                },
+                5,
+                event.correlation_id
+            ))
+            self.publish_events(pending)
+
     def _handle_mobile_note(self, event: EcosystemEvent):
         """Process mobile notes through AkashaOS memory"""
-        note = event.data.get('note', '')
-        
-        # Create awareness observation
-        self._create_observation("mobile_interface", f"User note: {note}")
-        
-        # Check if note indicates endearment (positive interaction)
-        sentiment_score = self._analyze_sentiment(note)
-        if sentiment_score > 0.6:
-            self._record_interaction("mobile_user", warmth=0.2)
-        
-        self.publish_event(
-            "note_processed",
-            {
-                "note": note,
-                "sentiment_score": sentiment_score,
-                "memory_updated": True
-            },
-            correlation_id=event.correlation_id
-        )
-    
+        with self.bus.batch():
+            note = event.data.get('note', '')
+
+            # Create awareness observation
+            self._create_observation("mobile_interface", f"User note: {note}")
+
+            # Check if note indicates endearment (positive interaction)
+            sentiment_score = _analyze_sentiment(note)
+            if sentiment_score > 0.6:
+                self._record_interaction("mobile_user", warmth=0.2)
+
+            self.publish_event(
+                "note_processed",
+                {
+                    "note": note,
+                    "sentiment_score": sentiment_score,
+                    "memory_updated": True
+                },
+                correlation_id=event.correlation_id
+            )
+
     def _activate_awareness_module(self, issue_data: Dict):
         """Activate awareness module for an issue"""
         observation = f"Focused awareness on: {issue_data.get('title')}"
@@ -138,112 +210,128 @@ class AkashaOSAdapter(EcosystemComponent):
             {"issue": issue_data, "goal": goal}
         )
     
-    def _create_observation(self, source: str, observation: str):
+    def _emit(self, pending: Optional[List[tuple]], event_type: str, data: Dict[str, Any]):
+        """Publish now, or queue onto pending for a later publish_events()"""
+        if pending is None:
+            self.publish_event(event_type, data)
+        else:
+            pending.append((event_type, data))
+    
+    def _create_observation(self, source: str, observation: str, pending: Optional[List[tuple]] = None):
         """Create an observation in AkashaOS memory"""
-        if "awareness_mod" not in self.akasha_memory:
-            self.akasha_memory["awareness_mod"] = {"observations": []}
-        
-        obs = {
-            "time": time.time(),
-            "source": source,
-            "note": observation
-        }
-        self.akasha_memory["awareness_mod"]["observations"].append(obs)
+        with self._locks["awareness_mod"]:
+            awareness = self.akasha_memory.setdefault("awareness_mod", {})
+            observations = awareness.get("observations")
+            if not isinstance(observations, deque):
+                # Memory reloaded from JSON holds plain dicts; convert them so every entry is an Observation
+                observations = awareness["observations"] = deque(
+                    (Observation(**o) if isinstance(o, dict) else o for o in observations or ()),
+                    maxlen=_MAX_OBSERVATIONS
+                )
+        
+        # deque.append is atomic, so appends don't need the lock
+        obs = Observation(time.time(), source, observation)
+        observations.append(obs)
+        self._mem_version = next(self._mem_counter)
         
         # Publish observation created
-        self.publish_event("observation_created", {"observation": obs})
+        self._emit(pending, "observation_created", {"observation": asdict(obs)})
     
-    def _create_desire(self, key: str, description: str, intensity: float):
+    def _create_desire(self, key: str, description: str, intensity: float,
+                       pending: Optional[List[tuple]] = None):
         """Create a desire in longing module"""
-        if "longing_mod" not in self.akasha_memory:
-            self.akasha_memory["longing_mod"] = {"desires": {}}
-        
-        self.akasha_memory["longing_mod"]["desires"][key] = {
-            "desc": description,
-            "intensity": intensity,
-            "created": time.time()
-        }
+        with self._locks["longing_mod"]:
+            longing = self.akasha_memory.setdefault("longing_mod", {})
+            desires = longing.get("desires")
+            if not isinstance(desires, OrderedDict):
+                desires = longing["desires"] = OrderedDict(desires or {})
+            
+            desires[key] = {
+                "desc": description,
+                "intensity": intensity,
+                "created": time.time()
+            }
+            desires.move_to_end(key)
+            while len(desires) > _MAX_DESIRES:
+                desires.popitem(last=False)
+            self._mem_version = next(self._mem_counter)
         
-        self.publish_event("desire_created", {"key": key, "description": description, "intensity": intensity})
+        self._emit(pending, "desire_created", {"key": key, "description": description, "intensity": intensity})
     
     def _record_interaction(self, entity: str, warmth: float):
         """Record interaction in endearment module"""
-        if "endearment_mod" not in self.akasha_memory:
-            self.akasha_memory["endearment_mod"] = {"affinities": {}}
-        
-        if entity not in self.akasha_memory["endearment_mod"]["affinities"]:
-            self.akasha_memory["endearment_mod"]["affinities"][entity] = {"score": 0.0}
-        
-        current_score = self.akasha_memory["endearment_mod"]["affinities"][entity]["score"]
-        new_score = min(1.0, current_score + warmth)
-        self.akasha_memory["endearment_mod"]["affinities"][entity]["score"] = new_score
+        with self._locks["endearment_mod"]:
+            endearment = self.akasha_memory.setdefault("endearment_mod", {})
+            affinities = endearment.get("affinities")
+            if not isinstance(affinities, defaultdict):
+                affinities = endearment["affinities"] = defaultdict(_new_affinity, affinities or {})
+            
+            # Affinities are bounded by the number of entities, so no cap is needed
+            affinity = affinities[entity]
+            new_score = min(1.0, affinity["score"] + warmth)
+            affinity["score"] = new_score
+            self._mem_version = next(self._mem_counter)
         
         self.publish_event("interaction_recorded", {"entity": entity, "warmth": warmth, "new_score": new_score})
     
     def _set_current_goal(self, goal: str):
         """Set current goal in planning module"""
-        if "plan_mod" not in self.akasha_memory:
-            self.akasha_memory["plan_mod"] = {}
-        
-        self.akasha_memory["plan_mod"]["current_goal"] = goal
+        with self._locks["plan_mod"]:
+            if "plan_mod" not in self.akasha_memory:
+                self.akasha_memory["plan_mod"] = {}
+            
+            self.akasha_memory["plan_mod"]["current_goal"] = goal
+            self._mem_version = next(self._mem_counter)
         self.publish_event("goal_set", {"goal": goal})
     
-    def _analyze_sentiment(self, text: str) -> float:
-        """Simple sentiment analysis (could be enhanced with real NLP)"""
-        positive_words = ['good', 'great', 'excellent', 'love', 'amazing', 'perfect', 'awesome', 'brilliant']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'horrible', 'worst', 'failed', 'broken']
-        
-        text_lower = text.lower()
-        positive_score = sum(1 for word in positive_words if word in text_lower)
-        negative_score = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_score + negative_score == 0:
-            return 0.5  # Neutral
-        
-        return positive_score / (positive_score + negative_score)
-    
     def _start_memory_monitor(self):
         """Monitor AkashaOS memory for changes and broadcast them"""
-        def monitor_loop():
-            last_memory_hash = None
-            while self.running:
-                try:
-                    # Simple change detection using JSON hash
-                    current_hash = hash(json.dumps(self.akasha_memory, sort_keys=True, default=str))
-                    if last_memory_hash and current_hash != last_memory_hash:
-                        self.publish_event(
-                            "memory_changed",
-                            {"timestamp": time.time(), "memory_keys": list(self.akasha_memory.keys())},
-                            priority=7
-                        )
-                    last_memory_hash = current_hash
-                    time.sleep(5)
-                except Exception as e:
-                    logger.error(f"Memory monitor error: {e}")
-        
-        monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
-        monitor_thread.start()
+        self._last_broadcast_version = self._mem_version
+        self.bus.scheduler.every(5, self._check_memory)
+    
+    def _check_memory(self):
+        """Broadcast memory_changed if any mutation happened since the last check"""
+        if not self.running:
+            return False
+        try:
+            # Change detection via the version counter bumped by each mutating helper
+            current_version = self._mem_version
+            if current_version != self._last_broadcast_version:
+                self.publish_event(
+                    "memory_changed",
+                    {"timestamp": time.time(), "memory_keys": list(self.akasha_memory.keys())},
+                    priority=7
+                )
+                self._last_broadcast_version = current_version
+        except Exception as e:
+            logger.error(f"Memory monitor error: {e}")
 
 class AetheriusAdapter(EcosystemComponent):
     """Adapter for Aetherius GitHub automation system"""
     
+    __slots__ = ("aetherius_engine", "_tracked_issues")
+    
     def __init__(self, bus: EcosystemBus, neural: EcosystemNeuralNetwork, aetherius_engine):
         super().__init__("aetherius", bus, neural)
         self.capabilities = {
-            "task_types": ["github_scanning", "issue_analysis", "automation", "code_review"],
-            "capabilities": ["scan_issues", "rank_priorities", "automate_responses", "track_progress"],
-            "apis": ["github_api"],
+            "task_types": ("github_scanning", "issue_analysis", "automation", "code_review"),
+            "capabilities": ("scan_issues", "rank_priorities", "automate_responses", "track_progress"),
+            "apis": ("github_api",),
             "rate_limits": {"github": 60, "llm": 20}
         }
         self.aetherius_engine = aetherius_engine
         
+        # Issues being tracked, keyed by URL; swept together by one periodic job
+        self._tracked_issues: Dict[str, Dict] = {}
+        
         # Subscribe to relevant events
         self.bus.subscribe("nexus.problem_selected", self._handle_problem_selection, self.name)
         self.bus.subscribe("akasha_os.goal_set", self._handle_goal_from_akasha, self.name)
         self.bus.subscribe("mobile.progress_added", self._handle_mobile_progress, self.name)
         
-        # Start GitHub scanning loop
+        # Start GitHub scanning and issue tracking loops
         self._start_scanning_loop()
+        self.bus.scheduler.every(300, self._check_tracked_issues)  # Check every 5 minutes
     
     def _handle_problem_selection(self, event: EcosystemEvent):
         """Handle when Nexus selects a problem to work on"""
@@ -269,7 +357,7 @@ class AetheriusAdapter(EcosystemComponent):
         """Handle goals set by AkashaOS that might relate to GitHub"""
         goal = event.data.get('goal', '')
         
-        if 'github' in goal.lower() or 'issue' in goal.lower():
+        if _GITHUB_GOAL_RE.search(goal):
             # This goal relates to GitHub work
             self.publish_event(
                 "github_goal_detected",
@@ -286,7 +374,7 @@ class AetheriusAdapter(EcosystemComponent):
         progress = event.data.get('progress', '')
         
         # Check if progress relates to a GitHub issue
-        if any(keyword in progress.lower() for keyword in ['fixed', 'implemented', 'completed', 'merged']):
+        if _PROGRESS_RE.search(progress):
             self.publish_event(
                 "github_progress_detected",
                 {
@@ -299,28 +387,33 @@ class AetheriusAdapter(EcosystemComponent):
     
     def _start_issue_tracking(self, problem: Dict):
         """Start tracking a GitHub issue"""
-        def tracking_loop():
-            issue_url = problem.get('url')
-            while self.running:
-                try:
-                    # Check issue status (mock implementation)
-                    status_update = self._check_issue_status(issue_url)
-                    if status_update:
-                        self.publish_event(
-                            "issue_status_update",
-                            {
-                                "problem_id": problem.get('id'),
-                                "status": status_update,
-                                "url": issue_url
-                            }
-                        )
-                    time.sleep(300)  # Check every 5 minutes
-                except Exception as e:
-                    logger.error(f"Issue tracking error: {e}")
-                    break
-        
-        tracking_thread = threading.Thread(target=tracking_loop, daemon=True)
-        tracking_thread.start()
+        url = problem.get('url')
+        if not url:
+            # Status checks go by URL, so there is nothing to poll for this one
+            logger.warning("Not tracking GitHub problem without a URL: %s", problem.get('title') or problem.get('id'))
+            return
+        self._tracked_issues[url] = problem
+    
+    def _check_tracked_issues(self):
+        """Check every tracked issue for status changes in one sweep"""
+        if not self.running:
+            return False
+        for issue_url, problem in list(self._tracked_issues.items()):
+            try:
+                # Check issue status (mock implementation)
+                status_update = self._check_issue_status(issue_url)
+                if status_update:
+                    self.publish_event(
+                        "issue_status_update",
+                        {
+                            "problem_id": problem.get('id'),
+                            "status": status_update,
+                            "url": issue_url
+                        }
+                    )
+            except Exception as e:
+                # Keep tracking; a transient failure shouldn't end it for good
+                logger.error(f"Issue tracking error: {e}")
     
     def _check_issue_status(self, issue_url: str) -> Optional[Dict]:
         """Check if GitHub issue status has changed"""
@@ -330,24 +423,22 @@ class AetheriusAdapter(EcosystemComponent):
     
     def _start_scanning_loop(self):
         """Start the GitHub issue scanning loop"""
-        def scanning_loop():
-            while self.running:
-                try:
-                    # Scan for new issues
-                    new_issues = self._scan_for_issues()
-                    for issue in new_issues:
-                        self.publish_event(
-                            "issue_discovered",
-                            issue,
-                            priority=3 if issue.get('priority') == 'high' else 5
-                        )
-                    
-                    time.sleep(600)  # Scan every 10 minutes
-                except Exception as e:
-                    logger.error(f"Scanning error: {e}")
-        
-        scanning_thread = threading.Thread(target=scanning_loop, daemon=True)
-        scanning_thread.start()
+        self.bus.scheduler.every(600, self._scan_tick)  # Scan every 10 minutes
+    
+    def _scan_tick(self):
+        """Scan for new issues and publish each one"""
+        if not self.running:
+            return False
+        try:
+            new_issues = self._scan_for_issues()
+            for issue in new_issues:
+                self.publish_event(
+                    "issue_discovered",
+                    issue,
+                    priority=3 if issue.get('priority') == 'high' else 5
+                )
+        except Exception as e:
+            logger.error(f"Scanning error: {e}")
     
     def _scan_for_issues(self) -> List[Dict]:
         """Scan GitHub for new issues"""
@@ -357,11 +448,13 @@ class AetheriusAdapter(EcosystemComponent):
 class NexusAdapter(EcosystemComponent):
     """Adapter for the Unified AI Nexus problem solver"""
     
+    __slots__ = ("nexus", "current_problem")
+    
     def __init__(self, bus: EcosystemBus, neural: EcosystemNeuralNetwork, nexus_instance):
         super().__init__("nexus", bus, neural)
         self.capabilities = {
-            "task_types": ["problem_solving", "priority_management", "work_coordination"],
-            "capabilities": ["prioritize_problems", "manage_queue", "coordinate_work", "track_progress"]
+            "task_types": ("problem_solving", "priority_management", "work_coordination"),
+            "capabilities": ("prioritize_problems", "manage_queue", "coordinate_work", "track_progress")
         }
         self.nexus = nexus_instance
         self.current_problem = None
@@ -385,7 +478,7 @@ class NexusAdapter(EcosystemComponent):
             "description": issue.get('description', ''),
             "source": "github",
             "url": issue.get('url'),
-            "priority": self._convert_priority(issue.get('priority')),
+            "priority": _NEXUS_PRIORITY.get(issue.get('priority'), "medium"),
             "status": "queued",
             "estimated_effort": issue.get('estimated_effort', 4)
         }
@@ -405,9 +498,10 @@ class NexusAdapter(EcosystemComponent):
         
         # Convert strong desires into problems
         if desire.get('intensity', 0) > 0.6:
+            key = desire.get('key')
             problem = {
-                "id": f"akasha_{desire.get('key')}",
-                "title": f"Fulfill desire: {desire.get('key')}",
+                "id": f"akasha_{key}",
+                "title": f"Fulfill desire: {key}",
                 "description": desire.get('description', ''),
                 "source": "akasha_os",
                 "priority": "medium",
@@ -441,20 +535,10 @@ class NexusAdapter(EcosystemComponent):
             # Select next problem
             self._select_next_problem()
     
-    def _convert_priority(self, github_priority: str) -> str:
-        """Convert GitHub priority to Nexus priority"""
-        priority_map = {
-            "critical": "high",
-            "high": "high",
-            "medium": "medium",
-            "low": "low"
-        }
-        return priority_map.get(github_priority, "medium")
-    
     def _add_problem_to_queue(self, problem: Dict):
         """Add problem to Nexus queue"""
         # Mock implementation - would integrate with real Nexus database
-        logger.info(f"Adding problem to queue: {problem['title']}")
+        logger.info("Adding problem to queue: %s", problem['title'])
     
     def _select_next_problem(self):
         """Select the next problem to work on"""
@@ -476,39 +560,40 @@ class NexusAdapter(EcosystemComponent):
     
     def _start_problem_management(self):
         """Start the problem management loop"""
-        def management_loop():
-            while self.running:
-                try:
-                    # Check if we need to select a new problem
-                    if not self.current_problem:
-                        self._select_next_problem()
-                    
-                    # Publish status update
-                    self.publish_event(
-                        "status_update",
-                        {
-                            "current_problem": self.current_problem,
-                            "queue_size": 0,  # Mock
-                            "total_completed": 0  # Mock
-                        },
-                        priority=8
-                    )
-                    
-                    time.sleep(120)  # Update every 2 minutes
-                except Exception as e:
-                    logger.error(f"Problem management error: {e}")
-        
-        management_thread = threading.Thread(target=management_loop, daemon=True)
-        management_thread.start()
+        self.bus.scheduler.every(120, self._manage_problems)  # Update every 2 minutes
+    
+    def _manage_problems(self):
+        """Select a problem if idle and publish a status update"""
+        if not self.running:
+            return False
+        try:
+            # Check if we need to select a new problem
+            if not self.current_problem:
+                self._select_next_problem()
+            
+            # Publish status update
+            self.publish_event(
+                "status_update",
+                {
+                    "current_problem": self.current_problem,
+                    "queue_size": 0,  # Mock
+                    "total_completed": 0  # Mock
+                },
+                priority=8
+            )
+        except Exception as e:
+            logger.error(f"Problem management error: {e}")
 
 class MobileBridgeAdapter(EcosystemComponent):
     """Adapter for mobile/Tasker integration"""
     
+    __slots__ = ()
+    
     def __init__(self, bus: EcosystemBus, neural: EcosystemNeuralNetwork):
         super().__init__("mobile_bridge", bus, neural)
         self.capabilities = {
-            "task_types": ["mobile_interaction", "notification", "human_interface"],
-            "capabilities": ["receive_notes", "send_notifications", "capture_progress", "human_feedback"]
+            "task_types": ("mobile_interaction", "notification", "human_interface"),
+            "capabilities": ("receive_notes", "send_notifications", "capture_progress", "human_feedback")
         }
         
         # Subscribe to events that should trigger mobile notifications
@@ -536,13 +621,13 @@ class MobileBridgeAdapter(EcosystemComponent):
         )
         
         # In real implementation, would send actual mobile notification
-        logger.info(f"📱 Mobile notification: {notification['title']}")
+        logger.info("📱 Mobile notification: %s", notification['title'])
     
     def _notify_issue_found(self, event: EcosystemEvent):
         """Notify mobile when interesting GitHub issue is found"""
         issue = event.data
         
-        if issue.get('priority') in ['high', 'critical']:
+        if issue.get('priority') in ('high', 'critical'):
             notification = {
                 "type": "high_priority_issue",
                 "title": f"High Priority Issue: {issue.get('title')}",
@@ -552,22 +637,23 @@ class MobileBridgeAdapter(EcosystemComponent):
             }
             
             self.publish_event("notification_sent", notification)
-            logger.info(f"📱 High priority issue notification: {notification['title']}")
+            logger.info("📱 High priority issue notification: %s", notification['title'])
     
     def _notify_desire_created(self, event: EcosystemEvent):
         """Notify mobile when AkashaOS creates a strong desire"""
         desire = event.data
         
-        if desire.get('intensity', 0) > 0.7:
+        intensity = desire.get('intensity', 0)
+        if intensity > 0.7:
             notification = {
                 "type": "strong_desire",
                 "title": f"AI Desire: {desire.get('key')}",
-                "body": f"Intensity: {desire.get('intensity'):.1f} - {desire.get('description')}",
+                "body": f"Intensity: {intensity:.1f} - {desire.get('description')}",
                 "actions": ["Fulfill", "Postpone"]
             }
             
             self.publish_event("notification_sent", notification)
-            logger.info(f"📱 Strong desire notification: {notification['title']}")
+            logger.info("📱 Strong desire notification: %s", notification['title'])
     
     def _notify_intelligence_chain(self, event: EcosystemEvent):
         """Notify mobile when intelligence chains are detected"""
@@ -581,7 +667,7 @@ class MobileBridgeAdapter(EcosystemComponent):
         }
         
         self.publish_event("notification_sent", notification)
-        logger.info(f"📱 Intelligence chain notification: {notification['title']}")
+        logger.info("📱 Intelligence chain notification: %s", notification['title'])
     
     def handle_mobile_note(self, note: str, correlation_id: str = None):
         """Handle note received from mobile interface"""
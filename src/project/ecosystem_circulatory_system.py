@@ -5,12 +5,15 @@ The missing piece that makes your distributed intelligence actually distributed
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import threading
 import time
 import uuid
 from collections import defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable, Any, Set
@@ -65,16 +68,75 @@ class EcosystemEvent:
     def is_expired(self):
         return datetime.now() > self.timestamp + timedelta(seconds=self.ttl_seconds)
 
+class EcosystemScheduler:
+    """Runs periodic callbacks from a single worker thread at their due times"""
+    
+    def __init__(self):
+        self._jobs: List[tuple] = []  # heap of (due, seq, interval, callback)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self.running = True
+        
+        worker = threading.Thread(target=self._run, name="ecosystem-scheduler", daemon=True)
+        worker.start()
+    
+    def every(self, interval: float, callback: Callable[[], Any], delay: float = 0.0):
+        """Call callback every interval seconds; it stops recurring once it returns False"""
+        with self._cond:
+            heapq.heappush(self._jobs, (time.monotonic() + delay, next(self._seq), interval, callback))
+            self._cond.notify()
+    
+    def _run(self):
+        while self.running:
+            with self._cond:
+                while self.running and (not self._jobs or self._jobs[0][0] > time.monotonic()):
+                    self._cond.wait(self._jobs[0][0] - time.monotonic() if self._jobs else None)
+                if not self.running:
+                    return
+                due, _, interval, callback = heapq.heappop(self._jobs)
+            
+            try:
+                keep = callback() is not False
+            except Exception as e:
+                logger.error(f"Scheduled callback error: {e}")
+                keep = True
+            
+            if keep:
+                with self._cond:
+                    next_due = max(due + interval, time.monotonic())
+                    heapq.heappush(self._jobs, (next_due, next(self._seq), interval, callback))
+    
+    def shutdown(self):
+        """Stop the worker thread; pending jobs are dropped"""
+        with self._cond:
+            self.running = False
+            self._cond.notify()
+
 class EcosystemBus:
     """Central message bus - the circulatory system"""
     
     def __init__(self, persistence_path: str = "ecosystem_events.db"):
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        # "prefix.*" subscriptions indexed by prefix, probed once per distinct prefix length
+        self._prefix_subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._prefix_lengths: tuple = ()
+        # Event type -> resolved (callback, kind) pairs; replaced wholesale on subscribe
+        self._dispatch: Dict[str, tuple] = {}
         self.event_history: deque = deque(maxlen=10000)
         self.active_correlations: Dict[str, List[EcosystemEvent]] = defaultdict(list)
         self.persistence_path = persistence_path
         self.running = True
         
+        # Shared timer thread for component polling work
+        self.scheduler = EcosystemScheduler()
+        
+        # Per-thread list of events awaiting persistence inside batch()
+        self._batch = threading.local()
+        
+        # Number of publish calls still dispatching, for wait_idle()
+        self._inflight = 0
+        self._idle = threading.Condition()
+        
         # Component health tracking
         self.component_heartbeats: Dict[str, datetime] = {}
         self.component_metadata: Dict[str, Dict] = {}
@@ -114,22 +176,21 @@ class EcosystemBus:
     
     def _start_background_tasks(self):
         """Start background maintenance tasks"""
-        def cleanup_task():
-            while self.running:
-                try:
-                    self._cleanup_expired_events()
-                    self._detect_stale_components()
-                    time.sleep(30)
-                except Exception as e:
-                    logger.error(f"Cleanup task error: {e}")
-        
-        cleanup_thread = threading.Thread(target=cleanup_task, daemon=True)
-        cleanup_thread.start()
+        self.scheduler.every(30, self._cleanup_task)
     
-    def publish(self, event_type: str, data: Dict[str, Any], source: str, 
-                priority: int = 5, correlation_id: str = None, tags: List[str] = None):
-        """Publish an event to the ecosystem"""
-        event = EcosystemEvent(
+    def _cleanup_task(self):
+        """Expire old events and flag stale components"""
+        if not self.running:
+            return False
+        try:
+            self._cleanup_expired_events()
+            self._detect_stale_components()
+        except Exception as e:
+            logger.error(f"Cleanup task error: {e}")
+    
+    def _new_event(self, event_type: str, data: Dict[str, Any], source: str, 
+                   priority: int = 5, correlation_id: str = None, tags: List[str] = None) -> EcosystemEvent:
+        return EcosystemEvent(
             id=str(uuid.uuid4()),
             type=event_type,
             data=data,
@@ -139,33 +200,98 @@ class EcosystemBus:
             correlation_id=correlation_id or str(uuid.uuid4()),
             tags=tags or []
         )
+    
+    def publish(self, event_type: str, data: Dict[str, Any], source: str, 
+                priority: int = 5, correlation_id: str = None, tags: List[str] = None):
+        """Publish an event to the ecosystem"""
+        self._enter_dispatch()
+        try:
+            event = self._new_event(event_type, data, source, priority, correlation_id, tags)
+            
+            # Store in history
+            self.event_history.append(event)
+            
+            # Store correlation
+            if event.correlation_id:
+                self.active_correlations[event.correlation_id].append(event)
+            
+            # Persist to database
+            self._persist_event(event)
+            
+            # Update statistics
+            self.event_stats[event_type] += 1
+            self.component_stats[source]['events_published'] += 1
+            
+            # Notify subscribers
+            self._notify_subscribers(event)
+            
+            # Update component heartbeat
+            self.component_heartbeats[source] = datetime.now()
+            
+            logger.info("📡 Event published: %s from %s", event_type, source)
+            return event.id
+        finally:
+            self._exit_dispatch()
+    
+    def publish_many(self, events: List[tuple]) -> List[str]:
+        """Publish several events at once; each tuple takes publish()'s positional arguments.
+        
+        All events are recorded and persisted in one write before any subscriber
+        is notified, then subscribers see them in order.
+        """
+        self._enter_dispatch()
+        try:
+            published = [self._new_event(*spec) for spec in events]
+            
+            for event in published:
+                self.event_history.append(event)
+                if event.correlation_id:
+                    self.active_correlations[event.correlation_id].append(event)
+                self.event_stats[event.type] += 1
+                self.component_stats[event.source]['events_published'] += 1
+            
+            pending = getattr(self._batch, "events", None)
+            if pending is not None:
+                pending.extend(published)
+            else:
+                self._persist_events(published)
+            
+            now = datetime.now()
+            for event in published:
+                self._notify_subscribers(event)
+                self.component_heartbeats[event.source] = now
+                logger.info("📡 Event published: %s from %s", event.type, event.source)
+            
+            return [event.id for event in published]
+        finally:
+            self._exit_dispatch()
+    
+    def _enter_dispatch(self):
+        with self._idle:
+            self._inflight += 1
+    
+    def _exit_dispatch(self):
+        with self._idle:
+            self._inflight -= 1
+            if not self._inflight:
+                self._idle.notify_all()
+    
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Block until no publish is dispatching on any thread; False on timeout.
         
-        # Store in history
-        self.event_history.append(event)
-        
-        # Store correlation
-        if event.correlation_id:
-            self.active_correlations[event.correlation_id].append(event)
-        
-        # Persist to database
-        self._persist_event(event)
-        
-        # Update statistics
-        self.event_stats[event_type] += 1
-        self.component_stats[source]['events_published'] += 1
-        
-        # Notify subscribers
-        self._notify_subscribers(event)
-        
-        # Update component heartbeat
-        self.component_heartbeats[source] = datetime.now()
-        
-        logger.info(f"📡 Event published: {event_type} from {source}")
-        return event.id
+        Not for use from inside a subscriber - its own publish counts as in flight.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._inflight, timeout)
     
     def subscribe(self, event_pattern: str, callback: Callable, component: str):
         """Subscribe to events matching pattern"""
         self.subscribers[event_pattern].append(callback)
+        if event_pattern.endswith('*') and event_pattern != '*':
+            prefix = event_pattern[:-1]
+            self._prefix_subscribers[prefix].append(callback)
+            self._prefix_lengths = tuple(sorted(set(self._prefix_lengths) | {len(prefix)}))
+        self._dispatch = {}
         self.component_stats[component]['subscriptions'] += 1
         logger.info(f"📻 {component} subscribed to {event_pattern}")
     
@@ -174,51 +300,77 @@ class EcosystemBus:
         for pattern in patterns:
             self.subscribe(pattern, callback, component)
     
+    def _resolve_subscribers(self, event_type: str) -> tuple:
+        """Build the (callback, kind) dispatch list for an event type"""
+        table = self._dispatch  # A concurrent subscribe swaps in a fresh dict; don't write into it
+        
+        resolved = [(callback, "Subscriber callback") for callback in self.subscribers.get(event_type, ())]
+        resolved += [(callback, "Wildcard subscriber") for callback in self.subscribers.get('*', ())]
+        for length in self._prefix_lengths:
+            if length > len(event_type):
+                break
+            resolved += [
+                (callback, "Pattern subscriber")
+                for callback in self._prefix_subscribers.get(event_type[:length], ())
+            ]
+        
+        table[event_type] = resolved = tuple(resolved)
+        return resolved
+    
     def _notify_subscribers(self, event: EcosystemEvent):
         """Notify all matching subscribers of an event"""
-        notified_count = 0
+        event_type = event.type
+        callbacks = self._dispatch.get(event_type)
+        if callbacks is None:
+            callbacks = self._resolve_subscribers(event_type)
         
-        # Exact match subscribers
-        for callback in self.subscribers.get(event.type, []):
-            try:
-                callback(event)
-                notified_count += 1
-            except Exception as e:
-                logger.error(f"Subscriber callback failed: {e}")
-        
-        # Wildcard subscribers (* matches all)
-        for callback in self.subscribers.get('*', []):
+        # Exact, then wildcard (*), then prefix subscribers
+        notified_count = 0
+        for callback, kind in callbacks:
             try:
                 callback(event)
                 notified_count += 1
             except Exception as e:
-                logger.error(f"Wildcard subscriber failed: {e}")
-        
-        # Pattern matching (simple prefix matching for now)
-        for pattern, callbacks in self.subscribers.items():
-            if pattern.endswith('*') and event.type.startswith(pattern[:-1]):
-                for callback in callbacks:
-                    try:
-                        callback(event)
-                        notified_count += 1
-                    except Exception as e:
-                        logger.error(f"Pattern subscriber failed: {e}")
+                logger.error(f"{kind} failed: {e}")
         
-        self.event_stats[f"{event.type}_notifications"] = notified_count
+        self.event_stats[f"{event_type}_notifications"] = notified_count
+    
+    @contextmanager
+    def batch(self):
+        """Persist every event published in this block (on this thread) in one transaction"""
+        if getattr(self._batch, "events", None) is not None:
+            yield  # Nested batch - the outermost one flushes
+            return
+        self._batch.events = []
+        try:
+            yield
+        finally:
+            events, self._batch.events = self._batch.events, None
+            self._persist_events(events)
     
     def _persist_event(self, event: EcosystemEvent):
-        """Persist event to database"""
+        """Persist event to database, or queue it if a batch is open"""
+        pending = getattr(self._batch, "events", None)
+        if pending is not None:
+            pending.append(event)
+        else:
+            self._persist_events([event])
+    
+    def _persist_events(self, events: List[EcosystemEvent]):
+        """Persist events to database with a single executemany"""
+        if not events:
+            return
         try:
             with sqlite3.connect(self.persistence_path) as conn:
-                conn.execute("""
+                conn.executemany("""
                     INSERT INTO events 
                     (id, type, source, timestamp, priority, correlation_id, data, tags)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                """, [(
                     event.id, event.type, event.source, event.timestamp.isoformat(),
                     event.priority, event.correlation_id, 
                     json.dumps(event.data), json.dumps(event.tags)
-                ))
+                ) for event in events])
         except Exception as e:
             logger.error(f"Failed to persist event: {e}")
     
@@ -268,6 +420,11 @@ class EcosystemBus:
                 priority=3
             )
     
+    def shutdown(self):
+        """Stop background maintenance and the shared scheduler immediately"""
+        self.running = False
+        self.scheduler.shutdown()
+    
     def get_ecosystem_health(self) -> Dict[str, Any]:
         """Get overall ecosystem health metrics"""
         return {
@@ -476,17 +633,15 @@ class EcosystemNeuralNetwork:
     
     def _start_neural_processing(self):
         """Start background neural processing"""
-        def neural_processing_loop():
-            while True:
-                try:
-                    self._detect_intelligence_opportunities()
-                    self._optimize_collaboration_patterns()
-                    time.sleep(60)  # Process every minute
-                except Exception as e:
-                    logger.error(f"Neural processing error: {e}")
-        
-        neural_thread = threading.Thread(target=neural_processing_loop, daemon=True)
-        neural_thread.start()
+        self.bus.scheduler.every(60, self._neural_processing_tick)  # Process every minute
+    
+    def _neural_processing_tick(self):
+        """Look for intelligence chains and collaboration patterns"""
+        try:
+            self._detect_intelligence_opportunities()
+            self._optimize_collaboration_patterns()
+        except Exception as e:
+            logger.error(f"Neural processing error: {e}")
     
     def _detect_intelligence_opportunities(self):
         """Detect opportunities for cross-component intelligence"""
@@ -565,6 +720,9 @@ class EcosystemNeuralNetwork:
 class EcosystemComponent:
     """Base class for ecosystem components with built-in bus integration"""
     
+    # Adapters declare their own __slots__ too; components are long-lived and numerous
+    __slots__ = ("name", "bus", "neural", "capabilities", "running", "__weakref__")
+    
     def __init__(self, component_name: str, bus: EcosystemBus, neural: EcosystemNeuralNetwork):
         self.name = component_name
         self.bus = bus
@@ -585,18 +743,17 @@ class EcosystemComponent:
     
     def _start_heartbeat(self):
         """Send regular heartbeats to show component is alive"""
-        def heartbeat_loop():
-            while self.running:
-                self.bus.publish(
-                    f"{self.name}.heartbeat",
-                    {"status": "alive", "capabilities": self.capabilities},
-                    self.name,
-                    priority=10  # Low priority
-                )
-                time.sleep(60)
-        
-        heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
-        heartbeat_thread.start()
+        self.bus.scheduler.every(60, self._heartbeat)
+    
+    def _heartbeat(self):
+        if not self.running:
+            return False
+        self.bus.publish(
+            f"{self.name}.heartbeat",
+            {"status": "alive", "capabilities": self.capabilities},
+            self.name,
+            priority=10  # Low priority
+        )
     
     def _handle_direct_event(self, event: EcosystemEvent):
         """Handle events directed at this component"""
@@ -621,6 +778,13 @@ class EcosystemComponent:
             correlation_id=correlation_id
         )
     
+    def publish_events(self, events: List[tuple]) -> List[str]:
+        """Publish (event_type, data[, priority[, correlation_id]]) tuples from this component together"""
+        return self.bus.publish_many([
+            (f"{self.name}.{event_type}", data, self.name, *rest)
+            for event_type, data, *rest in events
+        ])
+    
     def request_help(self, task_type: str, context: Dict[str, Any]) -> List[str]:
         """Request help from other components"""
         return self.neural.request_help(self.name, task_type, context)
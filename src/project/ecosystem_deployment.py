@@ -5,12 +5,22 @@ This brings your entire distributed intelligence system to life
 """
 
 import asyncio
+import atexit
 import os
+import queue
 import sys
 import signal
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import threading
 import json
 import yaml
+try:
+    import orjson
+except ImportError:  # Optional - stdlib json is used when it isn't installed
+    orjson = None
+from collections import Counter, deque
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Dict, Any
 
@@ -20,27 +30,56 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from ecosystem_circulatory_system import EcosystemBus, EcosystemNeuralNetwork
 from ecosystem_adapters import create_integrated_ecosystem
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: callers only enqueue records, a listener thread formats and writes them.
+# force=True replaces the plain handler ecosystem_circulatory_system installed on import.
+_log_queue = queue.Queue(-1)
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_output, respect_handler_level=True)
+_log_enqueue = QueueHandler(_log_queue)
+_log_enqueue.setFormatter(logging.Formatter('%(message)s'))  # Only merge args; the listener adds the prefix
+logging.basicConfig(level=logging.INFO, handlers=[_log_enqueue], force=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drains queued records before exit
 logger = logging.getLogger(__name__)
 
+# Safe YAML loader/dumper, backed by libyaml when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def _json_default(obj):
+    """Serialize memory records (e.g. slotted dataclasses) that json can't handle natively"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
+def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge src into dst in place, recursing where both sides hold a dict"""
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge(dst[key], value)
+        else:
+            dst[key] = value
+    return dst
+
 class EcosystemDeployment:
     """Main deployment orchestrator"""
     
-    def __init__(self, config_path: str = "ecosystem_config.yaml"):
-        self.config = self.load_config(config_path)
+    def __init__(self, config_path: str = "ecosystem_config.yaml", init_config: bool = False):
+        self.config = self.load_config(config_path, init_config)
         self.ecosystem = None
         self.running = True
+        self.stop_event = threading.Event()
+        self._shut_down = False
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.shutdown_handler)
         signal.signal(signal.SIGTERM, self.shutdown_handler)
     
-    def load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load ecosystem configuration"""
+    def load_config(self, config_path: str, init_config: bool = False) -> Dict[str, Any]:
+        """Load ecosystem configuration (init_config rewrites the file with the defaults)"""
         default_config = {
             "ecosystem": {
                 "name": "AI_Ecosystem_v1",
@@ -89,19 +128,34 @@ class EcosystemDeployment:
             }
         }
         
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
-                # Merge configs
-                default_config.update(user_config)
+        if init_config:
+            self._write_default_config(config_path, default_config)
+            return default_config
+        
+        try:
+            user_config = self._load_user_config(config_path)
+        except FileNotFoundError:
+            self._write_default_config(config_path, default_config)
+        except yaml.YAMLError as e:
+            # Leave the broken file for the user to fix rather than overwriting their settings
+            logger.error(f"Could not parse {config_path}, using built-in defaults: {e}")
         else:
-            # Create default config file
-            with open(config_path, 'w') as f:
-                yaml.dump(default_config, f, default_flow_style=False)
-            logger.info(f"Created default config file: {config_path}")
+            # Merge configs section by section so partial overrides keep the other defaults
+            _deep_merge(default_config, user_config)
         
         return default_config
     
+    def _write_default_config(self, config_path: str, default_config: Dict[str, Any]):
+        """Create the config file from the defaults"""
+        with open(config_path, 'w') as f:
+            yaml.dump(default_config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+        logger.info(f"Created default config file: {config_path}")
+    
+    def _load_user_config(self, config_path: str) -> Dict[str, Any]:
+        """Parse the user's YAML config"""
+        with open(config_path, 'r') as f:
+            return yaml.load(f, Loader=_YAML_LOADER) or {}
+    
     def setup_directories(self):
         """Set up required directories"""
         directories = [
@@ -127,13 +181,15 @@ class EcosystemDeployment:
         memory_file = akasha_config["memory_file"]
         memory = {}
         
-        if os.path.exists(memory_file):
-            try:
-                with open(memory_file, 'r') as f:
-                    memory = json.load(f)
-                logger.info(f"Loaded AkashaOS memory from {memory_file}")
-            except Exception as e:
-                logger.warning(f"Could not load memory file: {e}")
+        try:
+            with open(memory_file, 'rb') as f:
+                raw = f.read()
+            memory = orjson.loads(raw) if orjson else json.loads(raw)
+            logger.info(f"Loaded AkashaOS memory from {memory_file}")
+        except FileNotFoundError:
+            pass  # First run - start with empty memory
+        except Exception as e:
+            logger.warning(f"Could not load memory file: {e}")
         
         # Ensure default memory structure
         memory.setdefault("observations", [])
@@ -200,9 +256,8 @@ class EcosystemDeployment:
             logger.info("Mobile Bridge disabled in config")
             return
         
-        # Import and start mobile bridge in separate thread
+        # Import and start mobile bridge in separate thread (Flask's server is blocking WSGI)
         try:
-            import threading
             from mobile_bridge import MobileBridge
             
             def start_bridge():
@@ -210,7 +265,7 @@ class EcosystemDeployment:
                 bridge.config.update(mobile_config)
                 bridge.run()
             
-            bridge_thread = threading.Thread(target=start_bridge, daemon=True)
+            bridge_thread = threading.Thread(target=start_bridge, name="mobile-bridge", daemon=True)
             bridge_thread.start()
             
             logger.info(f"Mobile Bridge server started on port {mobile_config['port']}")
@@ -299,29 +354,46 @@ class EcosystemDeployment:
         print("  'test' - Run test scenarios")
         print("  'quit' - Shutdown ecosystem")
         
+        def add_note(note):
+            mobile_adapter.handle_mobile_note(note)
+            print(f"📝 Note added: {note}")
+        
+        def add_progress(progress):
+            mobile_adapter.handle_mobile_progress(progress)
+            print(f"📈 Progress added: {progress}")
+        
+        def complete():
+            mobile_adapter.handle_problem_completion("Completed via interactive mode")
+            print("✅ Problem marked as complete")
+        
+        # Bare commands (case-insensitive) and '<command> <text>' commands
+        commands = {
+            'status': self.print_ecosystem_status,
+            'health': self.print_detailed_health,
+            'test': self.run_test_scenarios,
+            'complete': complete,
+        }
+        text_commands = {
+            'note': add_note,
+            'progress': add_progress,
+        }
+        
         while self.running:
             try:
                 user_input = input("\n🤖 > ").strip()
+                command = user_input.lower()
                 
-                if user_input.lower() == 'quit':
+                if command == 'quit':
                     break
-                elif user_input.lower() == 'status':
-                    self.print_ecosystem_status()
-                elif user_input.lower() == 'health':
-                    self.print_detailed_health()
-                elif user_input.lower() == 'test':
-                    self.run_test_scenarios()
-                elif user_input.startswith('note '):
-                    note = user_input[5:]
-                    mobile_adapter.handle_mobile_note(note)
-                    print(f"📝 Note added: {note}")
-                elif user_input.startswith('progress '):
-                    progress = user_input[9:]
-                    mobile_adapter.handle_mobile_progress(progress)
-                    print(f"📈 Progress added: {progress}")
-                elif user_input.lower() == 'complete':
-                    mobile_adapter.handle_problem_completion("Completed via interactive mode")
-                    print("✅ Problem marked as complete")
+                handler = commands.get(command)
+                if handler:
+                    handler()
+                    continue
+                
+                name, sep, text = user_input.partition(' ')
+                text_handler = text_commands.get(name) if sep else None
+                if text_handler:
+                    text_handler(text)
                 else:
                     print("❓ Unknown command. Available: note, progress, complete, status, health, test, quit")
                     
@@ -340,32 +412,27 @@ class EcosystemDeployment:
         print("\n🔍 DETAILED HEALTH REPORT")
         print("-" * 50)
         
-        # Event flow analysis
+        # Event flow analysis - one pass over the recent events
         recent_events = self.ecosystem["bus"].get_recent_events(limit=20)
-        event_types = {}
+        event_types = Counter()
+        component_interactions = Counter()
+        correlations = Counter()
         for event in recent_events:
-            event_types[event.type] = event_types.get(event.type, 0) + 1
+            event_types[event.type] += 1
+            component_interactions[event.source] += 1
+            if event.correlation_id:
+                correlations[event.correlation_id] += 1
         
         print(f"📊 Recent Event Types (last 20):")
-        for event_type, count in sorted(event_types.items(), key=lambda x: x[1], reverse=True):
+        for event_type, count in event_types.most_common():
             print(f"   {event_type}: {count}")
         
         # Component interaction analysis
-        component_interactions = {}
-        for event in recent_events:
-            source = event.source
-            component_interactions[source] = component_interactions.get(source, 0) + 1
-        
         print(f"\n🤖 Component Activity:")
-        for component, activity in sorted(component_interactions.items(), key=lambda x: x[1], reverse=True):
+        for component, activity in component_interactions.most_common():
             print(f"   {component}: {activity} events")
         
         # Intelligence chain detection
-        correlations = {}
-        for event in recent_events:
-            if event.correlation_id:
-                correlations[event.correlation_id] = correlations.get(event.correlation_id, 0) + 1
-        
         active_chains = len([c for c in correlations.values() if c > 1])
         print(f"\n🧬 Intelligence Chains: {active_chains} active patterns")
         
@@ -387,49 +454,51 @@ class EcosystemDeployment:
         bus = self.ecosystem["bus"]
         mobile_adapter = self.ecosystem["adapters"]["mobile"]
         
-        # Test 1: GitHub Issue Discovery Chain
-        print("🔬 Test 1: GitHub Issue Discovery Chain")
-        bus.publish(
-            "aetherius.issue_discovered",
-            {
-                "id": "test_issue_001",
-                "title": "Add user authentication system",
-                "description": "Implement OAuth2 authentication for user login",
-                "priority": "high",
-                "url": "https://github.com/test/repo/issues/1",
-                "estimated_effort": 8
-            },
-            "test_runner",
-            priority=3
-        )
-        print("   ✅ GitHub issue discovery event published")
-        
-        # Test 2: Mobile Note Processing
-        print("\n🔬 Test 2: Mobile Note Processing")
-        mobile_adapter.handle_mobile_note("I want to focus on authentication bugs today. This is high priority!")
-        print("   ✅ Mobile note processed")
-        
-        # Test 3: Progress Update Chain
-        print("\n🔬 Test 3: Progress Update Chain")
-        mobile_adapter.handle_mobile_progress("Implemented OAuth2 login flow, testing needed")
-        print("   ✅ Progress update processed")
-        
-        # Test 4: Neural Pattern Detection
-        print("\n🔬 Test 4: Neural Pattern Detection")
-        bus.publish(
-            "akasha_os.desire_created",
-            {
-                "key": "implement_auth",
-                "description": "Strong desire to implement authentication",
-                "intensity": 0.9
-            },
-            "test_runner"
-        )
-        print("   ✅ High-intensity desire event published")
+        # Scenarios go through the real publish paths (including the mobile adapter's
+        # handlers); the batch only defers persistence to one write when it closes
+        with bus.batch():
+            # Test 1: GitHub Issue Discovery Chain
+            print("🔬 Test 1: GitHub Issue Discovery Chain")
+            bus.publish(
+                "aetherius.issue_discovered",
+                {
+                    "id": "test_issue_001",
+                    "title": "Add user authentication system",
+                    "description": "Implement OAuth2 authentication for user login",
+                    "priority": "high",
+                    "url": "https://github.com/test/repo/issues/1",
+                    "estimated_effort": 8
+                },
+                "test_runner",
+                priority=3
+            )
+            print("   ✅ GitHub issue discovery event published")
+
+            # Test 2: Mobile Note Processing
+            print("\n🔬 Test 2: Mobile Note Processing")
+            mobile_adapter.handle_mobile_note("I want to focus on authentication bugs today. This is high priority!")
+            print("   ✅ Mobile note processed")
+
+            # Test 3: Progress Update Chain
+            print("\n🔬 Test 3: Progress Update Chain")
+            mobile_adapter.handle_mobile_progress("Implemented OAuth2 login flow, testing needed")
+            print("   ✅ Progress update processed")
+
+            # Test 4: Neural Pattern Detection
+            print("\n🔬 Test 4: Neural Pattern Detection")
+            bus.publish(
+                "akasha_os.desire_created",
+                {
+                    "key": "implement_auth",
+                    "description": "Strong desire to implement authentication",
+                    "intensity": 0.9
+                },
+                "test_runner"
+            )
+            print("   ✅ High-intensity desire event published")
         
-        # Wait a moment for processing
-        import time
-        time.sleep(1)
+        # Wait until publishes still dispatching on other threads have finished
+        bus.wait_idle(timeout=1.0)
         
         print(f"\n📈 Test Results:")
         health = bus.get_ecosystem_health()
@@ -441,23 +510,38 @@ class EcosystemDeployment:
     
     def shutdown_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
+        if self.stop_event.is_set():
+            print(f"\n⏳ Already shutting down, ignoring signal ({signum})")
+            return
         print(f"\n🛑 Received shutdown signal ({signum})")
-        self.shutdown()
+        self.running = False
+        self.stop_event.set()
+        # Unwind the main thread (blocking input(), wait() or a test run) so main()
+        # performs the shutdown once, outside signal context. SIGTERM acts like Ctrl+C.
+        raise KeyboardInterrupt
     
     def shutdown(self):
         """Gracefully shutdown the ecosystem"""
         self.running = False
+        self.stop_event.set()
+        if self._shut_down:
+            return
+        self._shut_down = True
         
         if self.ecosystem:
             logger.info("🔄 Shutting down ecosystem components...")
             
-            # Shutdown all adapters
-            for name, adapter in self.ecosystem["adapters"].items():
-                try:
-                    adapter.shutdown()
-                    logger.info(f"   ✅ {name} adapter shutdown")
-                except Exception as e:
-                    logger.error(f"   ❌ {name} adapter shutdown failed: {e}")
+            # Shutdown all adapters; their shutdown events are persisted in one transaction
+            with self.ecosystem["bus"].batch():
+                for name, adapter in self.ecosystem["adapters"].items():
+                    try:
+                        adapter.shutdown()
+                        logger.info(f"   ✅ {name} adapter shutdown")
+                    except Exception as e:
+                        logger.error(f"   ❌ {name} adapter shutdown failed: {e}")
+            
+            # Stop the shared scheduler so no polling job outlives the adapters
+            self.ecosystem["bus"].shutdown()
             
             # Save final state
             try:
@@ -465,8 +549,15 @@ class EcosystemDeployment:
                 if akasha_config["enabled"]:
                     memory_file = akasha_config["memory_file"]
                     akasha_adapter = self.ecosystem["adapters"]["akasha"]
-                    with open(memory_file, 'w') as f:
-                        json.dump(akasha_adapter.akasha_memory, f, indent=2, default=str)
+                    memory = akasha_adapter.akasha_memory
+                    # Serialize before opening so a failure can't leave a truncated file behind
+                    if orjson:
+                        data = orjson.dumps(memory, default=_json_default,
+                                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                    else:
+                        data = json.dumps(memory, indent=2, default=_json_default).encode()
+                    with open(memory_file, 'wb') as f:
+                        f.write(data)
                     logger.info(f"   💾 AkashaOS memory saved to {memory_file}")
             except Exception as e:
                 logger.error(f"   ❌ Memory save failed: {e}")
@@ -483,11 +574,12 @@ def main():
     parser.add_argument('--mode', choices=['interactive', 'daemon', 'test'], default='interactive',
                        help='Run mode: interactive (default), daemon, or test')
     parser.add_argument('--status-only', action='store_true', help='Show status and exit')
+    parser.add_argument('--init-config', action='store_true', help='Rewrite the config file with the defaults before starting')
     
     args = parser.parse_args()
     
     # Create deployment instance
-    deployment = EcosystemDeployment(args.config)
+    deployment = EcosystemDeployment(args.config, init_config=args.init_config)
     
     try:
         # Start ecosystem
@@ -505,12 +597,13 @@ def main():
             # Daemon mode - just keep running
             print("🏃 Running in daemon mode (Ctrl+C to stop)")
             try:
-                while deployment.running:
-                    import time
-                    time.sleep(1)
+                # Wakes as soon as a shutdown signal arrives
+                deployment.stop_event.wait()
             except KeyboardInterrupt:
                 pass
         
+    except KeyboardInterrupt:
+        pass  # Signal handler already announced the shutdown
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         raise
@@ -8,29 +8,86 @@ that can unify conversations across AkashaOS, social platforms,
 forums, and external systems.
 """
 
+import os
 import time
 import json
+import weakref
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List
 
-FLARE_STORE = Path.home() / ".akasha_flare_feed.json"
+# One JSON object per line, appended as flares arrive
+FLARE_STORE = Path.home() / ".akasha_flare_feed.jsonl"
+LEGACY_FLARE_STORE = Path.home() / ".akasha_flare_feed.json"
+
+# Buffered records are written out after this many sightings (and at exit)
+FLUSH_EVERY = 32
 
 class FlareBridge:
     def __init__(self):
         self.feed: List[Dict] = []
+        # Sightings grouped by flare tag, sharing entries with self.feed
+        self._index: Dict[str, List[Dict]] = defaultdict(list)
         self._load_feed()
+        self._fh = open(FLARE_STORE, "a", buffering=64 * 1024)
+        self._unflushed = 0
+        if not self.feed:
+            self._migrate_legacy_feed()
+        # Closes (and so flushes) the handle at exit or when the bridge is collected,
+        # without atexit holding a reference that keeps every bridge alive
+        self._finalizer = weakref.finalize(self, self._fh.close)
+
+    def _add(self, entry: Dict):
+        # Index first: a line that isn't a flare record fails here before touching the feed
+        bucket = self._index[entry["flare"]]
+        self.feed.append(entry)
+        bucket.append(entry)
 
     def _load_feed(self):
-        if FLARE_STORE.exists():
+        self.feed = []
+        self._index.clear()
+        try:
+            f = open(FLARE_STORE, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            data = f.read()
+        for line in data.splitlines():
+            try:
+                self._add(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue  # Not a flare record
+        if data and not data.endswith(b"\n"):
+            # Unclean exit mid-write: drop the torn tail so the next append starts on a fresh line
+            tail = data.rfind(b"\n") + 1
             try:
-                self.feed = json.loads(FLARE_STORE.read_text())
-            except Exception:
-                self.feed = []
-        else:
-            self.feed = []
+                json.loads(data[tail:])
+            except ValueError:
+                os.truncate(FLARE_STORE, tail)
+            else:
+                with open(FLARE_STORE, "ab") as f:
+                    f.write(b"\n")
 
-    def _save_feed(self):
-        FLARE_STORE.write_text(json.dumps(self.feed, indent=2))
+    def _migrate_legacy_feed(self):
+        """Carry over a feed saved by the old whole-file JSON format"""
+        try:
+            legacy = json.loads(LEGACY_FLARE_STORE.read_text())
+        except Exception:
+            return  # Includes FileNotFoundError - nothing to migrate
+        for entry in legacy:
+            try:
+                self._add(entry)
+            except (KeyError, TypeError):
+                continue  # Not a flare record
+            self._fh.write(json.dumps(entry) + "\n")
+        self._fh.flush()
+
+    def flush(self):
+        self._fh.flush()
+        self._unflushed = 0
+
+    def close(self):
+        self._finalizer()
 
     def record_flare(self, flare: str, source: str, author: str, content: str):
         """Add a flare sighting to the feed"""
@@ -41,14 +98,17 @@ class FlareBridge:
             "content": content,
             "timestamp": time.time(),
         }
-        self.feed.append(entry)
-        self._save_feed()
+        self._add(entry)
+        self._fh.write(json.dumps(entry) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= FLUSH_EVERY:
+            self.flush()
         return entry
 
     def list_flares(self, flare: str = None):
         """List all flares, or filter by flare tag"""
         if flare:
-            return [e for e in self.feed if e["flare"] == flare]
+            return list(self._index.get(flare, ()))  # A copy; callers may sort or extend it
         return self.feed
 
 # Example usage
@@ -1,7 +1,8 @@
 
 import hashlib
 RUNES = "ᚠᚢᚦᚨᚱᚲᚷᚹᚺᚾᛁᛃᛇᛈᛉᛊ"
+# Rune pair for each digest byte (high nibble, low nibble) - skips hex encoding and int() parsing
+_PAIRS = [RUNES[(b >> 4) % len(RUNES)] + RUNES[(b & 15) % len(RUNES)] for b in range(256)]
 def sigil(word: str) -> str:
     if not word: return ""
-    h = hashlib.sha256(word.encode("utf-8")).hexdigest()[:24]
-    return "".join(RUNES[int(c,16) % len(RUNES)] for c in h)
+    return "".join(map(_PAIRS.__getitem__, hashlib.sha256(word.encode("utf-8")).digest()[:12]))
@@ -1,22 +1,30 @@
 
+import bisect
 import datetime
+import time
 ZODIAC=[(120,'Capricorn'),(219,'Aquarius'),(320,'Pisces'),(420,'Aries'),(521,'Taurus'),(621,'Gemini'),(722,'Cancer'),(823,'Leo'),(923,'Virgo'),(1023,'Libra'),(1122,'Scorpio'),(1222,'Sagittarius'),(1231,'Capricorn')]
+# Sign for every month*100+day key, filled once from the cutoffs above
+_ZODIAC_LUT=[]
+for _cutoff,_name in ZODIAC: _ZODIAC_LUT+=[_name]*(_cutoff+1-len(_ZODIAC_LUT))
 def western_zodiac(dt: datetime.date)->str:
-    md=dt.month*100+dt.day
-    for cutoff,name in ZODIAC:
-        if md<=cutoff: return name
-    return 'Capricorn'
+    return _ZODIAC_LUT[dt.month*100+dt.day]
 def lunar_phase_fraction(dt: datetime.date)->float:
     ref=datetime.date(2000,1,6)
     days=(dt-ref).days
     synodic=29.53058867
     return (days % synodic)/synodic
+_PHASE_TH=(0.02,0.24,0.26,0.49,0.51,0.74,0.76,0.98,1.01)
+_PHASE_NAME=('New Moon','Waxing Crescent','First Quarter','Waxing Gibbous','Full Moon','Waning Gibbous','Last Quarter','Waning Crescent','New Moon','New Moon')
 def lunar_phase_name(frac: float)->str:
-    phases=[(0.02,'New Moon'),(0.24,'Waxing Crescent'),(0.26,'First Quarter'),(0.49,'Waxing Gibbous'),(0.51,'Full Moon'),(0.74,'Waning Gibbous'),(0.76,'Last Quarter'),(0.98,'Waning Crescent'),(1.01,'New Moon')]
-    for th,name in phases:
-        if frac<=th: return name
-    return 'New Moon'
+    return _PHASE_NAME[bisect.bisect_left(_PHASE_TH,frac)]
+# (epoch second, result) for the current time; every field only changes once a second
+_LAST=(None,None)
 def celestial_time(dt: datetime.datetime|None=None)->dict:
-    dt=dt or datetime.datetime.utcnow()
+    global _LAST
+    if dt is not None: return _celestial(dt)
+    sec=int(time.time())
+    if _LAST[0]!=sec: _LAST=(sec,_celestial(datetime.datetime.fromtimestamp(sec,datetime.timezone.utc)))
+    return dict(_LAST[1])
+def _celestial(dt: datetime.datetime)->dict:
     frac=lunar_phase_fraction(dt.date())
     return {'gregorian':dt.strftime('%Y-%m-%d %H:%M:%S UTC'),'zodiac':western_zodiac(dt.date()),'lunar_phase_fraction':round(frac,4),'lunar_phase':lunar_phase_name(frac),'julian_day_approx':dt.toordinal()+1721424.5+(dt.hour+dt.minute/60+dt.second/3600)/24}
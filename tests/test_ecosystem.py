@@ -0,0 +1,291 @@
+import json
+import os
+import signal
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "project"))
+
+from ecosystem_adapters import AkashaOSAdapter, Observation, create_integrated_ecosystem
+from ecosystem_circulatory_system import EcosystemBus, EcosystemNeuralNetwork, EcosystemScheduler
+from ecosystem_deployment import EcosystemDeployment
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture
+def scheduler():
+    s = EcosystemScheduler()
+    yield s
+    s.shutdown()
+
+
+@pytest.fixture
+def bus(tmp_path):
+    b = EcosystemBus(str(tmp_path / "events.db"))
+    yield b
+    b.shutdown()
+
+
+def persisted_count(bus):
+    with sqlite3.connect(bus.persistence_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+# ---------- EcosystemScheduler ----------
+
+def test_scheduler_runs_jobs_in_due_order(scheduler):
+    calls = []
+    scheduler.every(60, lambda: calls.append("late") or False, delay=0.10)
+    scheduler.every(60, lambda: calls.append("early") or False, delay=0.05)
+    assert wait_until(lambda: len(calls) == 2)
+    assert calls == ["early", "late"]
+
+
+def test_scheduler_stops_job_that_returns_false(scheduler):
+    calls = []
+
+    def job():
+        calls.append(1)
+        return len(calls) < 3
+
+    scheduler.every(0.01, job)
+    assert wait_until(lambda: len(calls) == 3)
+    time.sleep(0.1)
+    assert len(calls) == 3
+
+
+def test_scheduler_keeps_job_after_exception(scheduler):
+    calls = []
+
+    def job():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+        return False
+
+    scheduler.every(0.01, job)
+    assert wait_until(lambda: len(calls) == 2)
+
+
+def test_scheduler_shutdown_drops_pending_jobs(scheduler):
+    calls = []
+    scheduler.every(0.01, lambda: calls.append(1))
+    assert wait_until(lambda: calls)
+    scheduler.shutdown()
+    time.sleep(0.05)
+    seen = len(calls)
+    time.sleep(0.1)
+    assert len(calls) == seen
+
+
+# ---------- EcosystemBus ----------
+
+def test_batch_persists_on_exit(bus):
+    with bus.batch():
+        bus.publish("test.one", {}, "tester")
+        bus.publish_many([("test.two", {}, "tester"), ("test.three", {}, "tester")])
+        assert persisted_count(bus) == 0
+    assert persisted_count(bus) == 3
+
+
+def test_batch_persists_when_block_raises(bus):
+    with pytest.raises(RuntimeError):
+        with bus.batch():
+            bus.publish("test.one", {}, "tester")
+            raise RuntimeError
+    assert persisted_count(bus) == 1
+
+
+def test_nested_batch_flushes_once_at_outermost_exit(bus):
+    with bus.batch():
+        with bus.batch():
+            bus.publish("test.one", {}, "tester")
+        assert persisted_count(bus) == 0
+    assert persisted_count(bus) == 1
+
+
+def test_dispatch_order_exact_wildcard_prefix(bus):
+    calls = []
+    bus.subscribe("akasha.*", lambda e: calls.append(("prefix", e.type)), "t")
+    bus.subscribe("*", lambda e: calls.append(("wildcard", e.type)), "t")
+    bus.subscribe("akasha.goal", lambda e: calls.append(("exact", e.type)), "t")
+
+    bus.publish("akasha.goal", {}, "tester")
+    bus.publish("other.goal", {}, "tester")
+    assert calls == [
+        ("exact", "akasha.goal"),
+        ("wildcard", "akasha.goal"),
+        ("prefix", "akasha.goal"),
+        ("wildcard", "other.goal"),
+    ]
+
+
+def test_subscribe_after_publish_resets_dispatch_cache(bus):
+    calls = []
+    bus.publish("nexus.problem_selected", {}, "tester")
+    bus.subscribe("nexus.*", lambda e: calls.append("short"), "t")
+    bus.subscribe("nexus.problem_*", lambda e: calls.append("long"), "t")
+    bus.publish("nexus.problem_selected", {}, "tester")
+    bus.publish("nexus.status_update", {}, "tester")
+    assert calls == ["short", "long", "short"]
+
+
+def test_failing_subscriber_does_not_block_others(bus):
+    calls = []
+
+    def broken(event):
+        raise ValueError("boom")
+
+    bus.subscribe("test.*", broken, "t")
+    bus.subscribe("test.*", lambda e: calls.append(e.type), "t")
+    bus.publish("test.event", {}, "tester")
+    assert calls == ["test.event"]
+
+
+def test_wait_idle_waits_for_publish_on_other_thread(bus):
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow(event):
+        entered.set()
+        release.wait(2)
+
+    bus.subscribe("slow.event", slow, "t")
+    publisher = threading.Thread(target=bus.publish, args=("slow.event", {}, "tester"))
+    publisher.start()
+    assert entered.wait(2)
+
+    assert bus.wait_idle(timeout=0.05) is False
+    release.set()
+    assert bus.wait_idle(timeout=2) is True
+    publisher.join(2)
+
+
+def test_wait_idle_returns_immediately_when_idle(bus):
+    assert bus.wait_idle(timeout=0) is True
+
+
+# ---------- AkashaOSAdapter ----------
+
+@pytest.fixture
+def akasha(bus):
+    # Tests drive _check_memory() themselves; keep the scheduler from running it too
+    bus.scheduler.shutdown()
+    return AkashaOSAdapter(bus, EcosystemNeuralNetwork(bus), {})
+
+
+def memory_changed_events(bus):
+    return bus.get_recent_events("akasha_os.memory_changed")
+
+
+def test_memory_monitor_broadcasts_only_after_mutation(akasha, bus):
+    akasha._check_memory()
+    assert memory_changed_events(bus) == []
+
+    akasha._set_current_goal("ship it")
+    akasha._check_memory()
+    assert len(memory_changed_events(bus)) == 1
+
+    akasha._check_memory()
+    assert len(memory_changed_events(bus)) == 1
+
+
+def test_memory_version_is_unique_across_threads(akasha):
+    seen = []
+
+    def mutate():
+        for i in range(200):
+            akasha._create_observation("test", f"note {i}", pending=[])
+            seen.append(akasha._mem_version)
+
+    workers = [threading.Thread(target=mutate) for _ in range(8)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    # Every mutation draws its own number, so none is lost to a racing update
+    assert next(akasha._mem_counter) == 8 * 200 + 1
+    assert akasha._mem_version != akasha._last_broadcast_version
+
+
+# ---------- Config loading ----------
+
+def load_config(path, **kwargs):
+    # load_config reads no instance state; skip __init__'s signal handler setup
+    return EcosystemDeployment.__new__(EcosystemDeployment).load_config(str(path), **kwargs)
+
+
+def test_missing_config_is_written_and_reloads_identically(tmp_path):
+    path = tmp_path / "ecosystem_config.yaml"
+    first = load_config(path)
+    assert path.exists()
+    assert load_config(path) == first
+    assert first["components"]["mobile_bridge"]["port"] == 8080
+
+
+def test_user_config_deep_merges_over_defaults(tmp_path):
+    path = tmp_path / "ecosystem_config.yaml"
+    path.write_text(yaml.safe_dump({
+        "ecosystem": {"name": "Custom"},
+        "components": {"aetherius": {"rate_limits": {"github": 5}}},
+        "extra": [1, 2],
+    }))
+    config = load_config(path)
+    assert config["ecosystem"]["name"] == "Custom"
+    assert config["ecosystem"]["log_level"] == "INFO"
+    assert config["components"]["aetherius"]["rate_limits"] == {"github": 5, "llm": 20}
+    assert config["components"]["nexus"]["enabled"] is True
+    assert config["extra"] == [1, 2]
+
+
+def test_unparseable_config_is_left_in_place(tmp_path):
+    path = tmp_path / "ecosystem_config.yaml"
+    path.write_text("ecosystem: [unclosed\n")
+    config = load_config(path)
+    assert config["ecosystem"]["name"] == "AI_Ecosystem_v1"
+    assert path.read_text() == "ecosystem: [unclosed\n"
+
+
+def test_init_config_overwrites_user_config(tmp_path):
+    path = tmp_path / "ecosystem_config.yaml"
+    path.write_text("ecosystem:\n  name: Custom\n")
+    config = load_config(path, init_config=True)
+    assert config["ecosystem"]["name"] == "AI_Ecosystem_v1"
+    assert yaml.safe_load(path.read_text())["ecosystem"]["name"] == "AI_Ecosystem_v1"
+
+
+# ---------- Memory persistence ----------
+
+def test_observations_round_trip_through_restarts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(signal, "signal", lambda *args: None)
+    memory_file = tmp_path / "memory.json"
+
+    for run in range(2):
+        deployment = EcosystemDeployment(str(tmp_path / "ecosystem_config.yaml"))
+        deployment.config["components"]["akasha_os"]["memory_file"] = str(memory_file)
+        deployment.ecosystem = create_integrated_ecosystem(deployment.initialize_akasha_os(), None, None)
+        akasha = deployment.ecosystem["adapters"]["akasha"]
+        akasha._create_observation("test", f"run {run}", pending=[])
+
+        observations = akasha.akasha_memory["awareness_mod"]["observations"]
+        assert all(isinstance(o, Observation) for o in observations)
+        assert [o.note for o in observations] == [f"run {i}" for i in range(run + 1)]
+        deployment.shutdown()
+
+    saved = json.loads(memory_file.read_text())
+    assert [o["note"] for o in saved["awareness_mod"]["observations"]] == ["run 0", "run 1"]
@@ -0,0 +1,97 @@
+import gc
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "project", "flare_bridge"))
+
+import flare_bridge
+from flare_bridge import FlareBridge
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    path = tmp_path / "feed.jsonl"
+    monkeypatch.setattr(flare_bridge, "FLARE_STORE", path)
+    monkeypatch.setattr(flare_bridge, "LEGACY_FLARE_STORE", tmp_path / "feed.json")
+    return path
+
+
+def record(flare, content):
+    return json.dumps({"flare": flare, "content": content}) + "\n"
+
+
+def test_torn_tail_is_truncated_and_next_record_survives(store):
+    store.write_text(record("a", "kept") + '{"flare": "a", "cont')
+    fb = FlareBridge()
+    assert [e["content"] for e in fb.list_flares()] == ["kept"]
+    assert store.read_text() == record("a", "kept")
+
+    fb.record_flare("a", "src", "me", "after crash")
+    fb.close()
+    assert [e["content"] for e in FlareBridge().list_flares("a")] == ["kept", "after crash"]
+
+
+def test_complete_tail_without_newline_gets_one(store):
+    store.write_text(record("a", "first") + record("a", "last").rstrip("\n"))
+    fb = FlareBridge()
+    assert store.read_text() == record("a", "first") + record("a", "last")
+
+    fb.record_flare("a", "src", "me", "next")
+    fb.close()
+    assert [e["content"] for e in FlareBridge().list_flares()] == ["first", "last", "next"]
+
+
+def test_lines_that_are_not_flare_records_are_skipped(store):
+    store.write_text(
+        record("a", "one")
+        + "[1, 2]\n"
+        + '{"no_flare": true}\n'
+        + '{"flare": ["unhashable"]}\n'
+        + "not json\n"
+        + record("b", "two")
+    )
+    fb = FlareBridge()
+    assert [e["content"] for e in fb.list_flares()] == ["one", "two"]
+    assert [e["content"] for e in fb.list_flares("b")] == ["two"]
+
+
+def test_legacy_feed_is_migrated_once(store):
+    flare_bridge.LEGACY_FLARE_STORE.write_text(json.dumps([
+        {"flare": "a", "content": "old"},
+        {"content": "no tag"},
+        {"flare": "b", "content": "older"},
+    ]))
+    fb = FlareBridge()
+    assert [e["content"] for e in fb.list_flares()] == ["old", "older"]
+    fb.close()
+    assert store.read_text() == record("a", "old") + record("b", "older")
+
+    # The JSONL feed is no longer empty, so a second start doesn't migrate again
+    assert len(FlareBridge().list_flares()) == 2
+
+
+def test_buffered_records_are_written_on_close(store):
+    fb = FlareBridge()
+    fb.record_flare("a", "src", "me", "buffered")
+    assert store.read_text() == ""
+    fb.close()
+    fb.close()  # Idempotent
+    assert json.loads(store.read_text())["content"] == "buffered"
+
+
+def test_collected_bridge_flushes_its_records(store):
+    fb = FlareBridge()
+    fb.record_flare("a", "src", "me", "buffered")
+    del fb
+    gc.collect()
+    assert json.loads(store.read_text())["content"] == "buffered"
+
+
+def test_list_flares_returns_a_copy(store):
+    fb = FlareBridge()
+    fb.record_flare("a", "src", "me", "one")
+    fb.list_flares("a").clear()
+    assert len(fb.list_flares("a")) == 1
@@ -7,8 +7,8 @@ Interactive fractal fish aquarium:
 - Drag files in to feed fish and change their color/size/behavior
 """
 
-import pygame, math, random, sys, os, hashlib, mimetypes
-from PIL import Image
+import pygame, math, random, sys, os, zlib, mimetypes, functools
+from PIL import Image, ImageStat
 
 # ---------- Setup ----------
 pygame.init()
@@ -18,17 +18,50 @@ clock = pygame.time.Clock()
 pygame.display.set_caption("Fractal Aquarium")
 
 # ---------- Helper Functions ----------
-def entropy_color(path):
-    """Generate a color from file entropy (first 4KB)."""
+@functools.lru_cache(maxsize=256)
+def _entropy_color_cached(path, mtime_ns, size):
+    # mtime/size are only part of the key, so an edited file is hashed again
+    # Raw fd read: no buffered file object for a single small read
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
     try:
-        with open(path, "rb") as f:
-            data = f.read(4096)
-        h = hashlib.sha256(data).hexdigest()
-        return (int(h[0:2],16), int(h[2:4],16), int(h[4:6],16))
+        data = os.read(fd, 256)
+    finally:
+        os.close(fd)
+    # Only 3 well-mixed bytes are needed; CRC32 gives them without a cryptographic hash
+    h = zlib.crc32(data)
+    return (h & 0xFF, (h >> 8) & 0xFF, (h >> 16) & 0xFF)
+
+def entropy_color(path, st=None):
+    """Generate a color from file entropy (first 256 bytes). st: the file's os.stat result, if already known."""
+    try:
+        if st is None:
+            st = os.stat(path)
+        return _entropy_color_cached(path, st.st_mtime_ns, st.st_size)
     except Exception:
         return (200,200,200)
+entropy_color.cache_clear = _entropy_color_cached.cache_clear
+
+@functools.lru_cache(maxsize=1024)
+def mime_for_ext(ext):
+    """MIME type for a file extension; guess_type only looks at the extension anyway."""
+    return mimetypes.guess_type("x" + ext)[0]
+
+def img_entropy(img):
+    """Shannon entropy (bits) of an image's histogram."""
+    if hasattr(img, "entropy"):
+        return img.entropy()  # Pillow 6.1+, computed in C
+    hist = img.histogram()
+    t = img.width * img.height * len(img.getbands())
+    return math.fsum(p/t * math.log2(t/p) for p in hist if p)
 
 # ---------- Fractal Fish ----------
+# sin/cos of t and 2t for the 120 points of a fish (t = i/20). draw() rotates these by the
+# fish's phase with the angle-addition formulas, so a frame needs 2 trig calls per fish, not 240.
+FIGURE = [(math.sin(i/20.0), math.cos(i/20.0), math.sin(i/10.0), math.cos(i/10.0)) for i in range(120)]
+
+# Pre-rolled color drift steps in -2..2 per channel; each fish walks the table from its own offset
+JITTER = [(random.randint(-2,2), random.randint(-2,2), random.randint(-2,2)) for _ in range(1024)]
+
 class FractalFish:
     def __init__(self, entropy_seed=None):
         self.x = random.randint(0, WIDTH)
@@ -39,6 +72,10 @@ class FractalFish:
         self.size = random.randint(20, 60)
         self.entropy_seed = entropy_seed or random.random()
         self.behavior = "default"
+        self._jitter_i = random.randrange(len(JITTER))
+        # The fish's dot, re-rendered only when its color changes; draw() blits it per point
+        self._dot = pygame.Surface((4, 4)).convert()
+        self._dot_color = None
 
     def update(self):
         self.x += math.cos(self.phase + self.entropy_seed) * self.speed
@@ -46,20 +83,43 @@ class FractalFish:
         self.phase += 0.02
         self.x %= WIDTH
         self.y %= HEIGHT
-        self.color = [(c + random.randint(-2,2)) % 256 for c in self.color]
+        dr, dg, db = JITTER[self._jitter_i]
+        self._jitter_i = (self._jitter_i + 1) % len(JITTER)
+        r, g, b = self.color
+        # & 255 wraps negatives the same way % 256 does, without the division
+        self.color = [(r + dr) & 255, (g + dg) & 255, (b + db) & 255]
+
+    def _render_dot(self, color):
+        # A radius-2 circle exactly fills 4x4; the colorkey differs from the color in red
+        key = ((color[0] + 128) & 255, color[1], color[2])
+        self._dot.fill(key)
+        self._dot.set_colorkey(key)
+        pygame.draw.circle(self._dot, color, (2, 2), 2)
+        self._dot_color = color
+
+    def dots(self):
+        """(dot surface, top-left) pairs for this frame, ready for Surface.blits()."""
+        color = tuple(self.color)
+        if color != self._dot_color:
+            self._render_dot(color)
+        dot = self._dot
+        # dx = sin(t + phase) * size, dy = cos(2t + phase) * size/2
+        sp, cp = math.sin(self.phase), math.cos(self.phase)
+        half = self.size / 2
+        ax, bx = cp * self.size, sp * self.size
+        ay, by = cp * half, sp * half
+        x, y = self.x, self.y
+        # Blit at the dot's top-left: the point's center minus the radius
+        return [(dot, (int(x + st*ax + ct*bx) - 2, int(y + c2t*ay - s2t*by) - 2)) for st, ct, s2t, c2t in FIGURE]
 
     def draw(self, surface):
-        for i in range(120):
-            t = i / 20.0
-            dx = math.sin(t + self.phase) * self.size
-            dy = math.cos(2*t + self.phase) * self.size/2
-            px, py = int(self.x + dx), int(self.y + dy)
-            pygame.draw.circle(surface, self.color, (px, py), 2)
+        surface.blits(self.dots(), False)
 
     def feed(self, filepath):
         try:
-            size = os.path.getsize(filepath)
-            mime, _ = mimetypes.guess_type(filepath)
+            st = os.stat(filepath)  # One stat for the size here and entropy_color's cache key
+            size = st.st_size
+            mime = mime_for_ext(os.path.splitext(filepath)[1].lower())
 
             # Empty file → Ghost
             if size == 0:
@@ -85,9 +145,12 @@ class FractalFish:
             # Images → Mimicry
             elif mime and "image" in mime:
                 with Image.open(filepath) as img:
-                    img = img.resize((1,1))
-                    r,g,b = img.getpixel((0,0))
+                    img.draft("RGB", (64,64))  # JPEGs decode at up to 1/8 scale
+                    rgb = img.convert("RGB")
+                # Mean color straight from the C histogram, no resampling
+                r,g,b = (int(c) for c in ImageStat.Stat(rgb).mean)
                 self.color = [r,g,b]
+                self.entropy_seed = img_entropy(rgb)  # Busier images swim a different course
                 self.speed = 1.5
                 self.size = 60
                 self.behavior = "mimic"
@@ -101,7 +164,7 @@ class FractalFish:
 
             # Other → Default
             else:
-                self.color = list(entropy_color(filepath))
+                self.color = list(entropy_color(filepath, st))
                 self.size = 40 + (size % 60)
                 self.behavior = "default"
 
@@ -110,16 +173,24 @@ class FractalFish:
 
 # ---------- Starfield ----------
 class Starfield:
-    def __init__(self, count=200):
+    def __init__(self, count=200, background=(0,0,30)):
         self.stars = [(random.randint(0,WIDTH), random.randint(0,HEIGHT), random.randint(1,3)) for _ in range(count)]
-    def draw(self, surface):
+        # Stars never move: render them once over the background, then draw() is one opaque blit
+        self._cached = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._cached.fill(background)
         for x,y,r in self.stars:
-            pygame.draw.circle(surface, (100,100,200), (x,y), r)
+            pygame.draw.circle(self._cached, (100,100,200), (x,y), r)
+    def draw(self, surface):
+        # Also clears the frame, so the main loop needs no fill()
+        surface.blit(self._cached, (0,0))
 
 # ---------- Main Loop ----------
+DRAW_INTERVAL = 1 / 30  # seconds between redraws
+
 def main():
     fish = [FractalFish() for _ in range(12)]
     stars = Starfield()
+    accum = DRAW_INTERVAL  # Draw the first frame straight away
 
     while True:
         for event in pygame.event.get():
@@ -131,15 +202,23 @@ def main():
                 path = event.file
                 random.choice(fish).feed(path)
 
-        screen.fill((0,0,30))
-        stars.draw(screen)
-
         for f in fish:
             f.update()
-            f.draw(screen)
 
-        pygame.display.flip()
-        clock.tick(60)
+        # Motion stays at 60 Hz; the points themselves are only drawn at 30 Hz
+        if accum >= DRAW_INTERVAL:
+            accum -= DRAW_INTERVAL
+            if accum >= DRAW_INTERVAL:
+                accum = 0.0  # Fell behind: drop the backlog rather than draw it all
+            stars.draw(screen)
+            # The whole fleet in one blits() call
+            batch = []
+            for f in fish:
+                batch += f.dots()
+            screen.blits(batch, False)
+            pygame.display.flip()
+
+        accum += clock.tick(60) / 1000.0
 
 if __name__ == "__main__":
     main()